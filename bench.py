@@ -0,0 +1,373 @@
+# Route-level benchmark sa ibabaw sa seed.py data.
+#
+#   DATABASE_URL=sqlite:////tmp/seven33.db python bench.py                      # Flask test client
+#   DATABASE_URL=sqlite:////tmp/seven33.db python bench.py --mode http \
+#       --url http://127.0.0.1:5000 --concurrency 16                            # running server
+#   python bench.py --compare bench_results/old.json bench_results/new.json
+#   DATABASE_URL=sqlite:////tmp/seven33.db python bench.py --delete-timing 100000   # viral post delete
+#   DATABASE_URL=sqlite:////tmp/seven33.db python bench.py --follow-timing 100000   # celebrity follow graph
+#   DATABASE_URL=sqlite:////tmp/seven33.db python bench.py --mode http \
+#       --profiles sync,threads,eventlet --concurrency 64                       # gunicorn.conf.py profiles
+#
+# Ang SQL statement count gikan sa X-Query-Count header (tan-awa ang REQUEST METRICS sa app.py),
+# so parehas ang numbers sa duha ka mode. Ang header kay para sa admins ra; ang bench mo-opt in
+# gamit ang X-Metrics-Token. Sa --mode http, i-start ang server nga parehas ang METRICS_TOKEN env.
+import argparse
+import json
+import os
+import random
+import secrets
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, or_
+
+# Local tool: random SECRET_KEY kung wala; ang --profiles gunicorn servers mo-inherit ani (parehas nga cookies)
+os.environ.setdefault('SECRET_KEY', secrets.token_hex(32))
+
+from app import (app, db, User, Post, Like, Comment, Notification, Follow, Conversation,
+                 delete_posts, delete_users, follow_graph)
+from seed import SEED_PASSWORD, bulk_insert, fix_sequences
+
+METRICS_TOKEN = app.config['METRICS_TOKEN'] or secrets.token_hex(16)
+app.config['METRICS_TOKEN'] = METRICS_TOKEN
+METRICS_HEADERS = {'X-Metrics-Token': METRICS_TOKEN}
+
+SCENARIOS = ['home', 'following', 'profile', 'followers', 'messages', 'like', 'toggle', 'unread']
+
+def sample_targets(rng, viewers=20):
+    # Pilion ang mga active users (daghan og follows) para realistic ang Following tab ug inbox
+    active = [uid for (uid,) in db.session.query(Follow.follower_id).group_by(Follow.follower_id)
+              .order_by(func.count(Follow.id).desc()).limit(viewers)]
+    if not active:
+        active = [uid for (uid,) in db.session.query(User.id).limit(viewers)]
+    usernames = [name for (name,) in db.session.query(User.username).order_by(User.follower_count.desc()).limit(200)]
+    post_ids = [pid for (pid,) in db.session.query(Post.id).order_by(Post.id.desc()).limit(2000)]
+    partners = {}
+    for uid in active:
+        convo = Conversation.query.filter(or_(Conversation.user_low_id == uid, Conversation.user_high_id == uid)).first()
+        if convo:
+            partners[uid] = convo.user_high_id if convo.user_low_id == uid else convo.user_low_id
+    names = dict(db.session.query(User.id, User.username).filter(User.id.in_(active)))
+    return {'viewers': active, 'names': names, 'usernames': usernames, 'post_ids': post_ids, 'partners': partners}
+
+def build_request(scenario, viewer, targets, rng):
+    if scenario == 'home': return 'GET', '/'
+    if scenario == 'following': return 'GET', '/?tab=following'
+    if scenario == 'profile': return 'GET', f"/user/{rng.choice(targets['usernames'])}"
+    if scenario == 'followers': return 'GET', f"/user/{rng.choice(targets['usernames'][:20])}/followers"
+    if scenario == 'messages': return 'GET', f"/messages/{targets['partners'].get(viewer, viewer % 2 + 1)}"
+    if scenario == 'like': return 'POST', f"/like/{rng.choice(targets['post_ids'])}"
+    # Double-click/script nga nag-toggle sa parehas nga post (mao ni ang i-shed sa rate limiter)
+    if scenario == 'toggle': return 'POST', f"/like/{targets['post_ids'][viewer % len(targets['post_ids'])]}"
+    if scenario == 'unread': return 'GET', '/api/unread-count'
+    raise ValueError(scenario)
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+def summarize(latencies, queries, statuses, wall):
+    # 429 = gi-shed sa rate limiter, dili error
+    shed = sum(s == 429 for s in statuses)
+    return {
+        'requests': len(latencies),
+        'errors': sum(s >= 400 and s != 429 for s in statuses),
+        'shed': shed,
+        'shed_pct': round(shed / len(statuses) * 100, 2) if statuses else 0.0,
+        'throughput_rps': round(len(latencies) / wall, 2) if wall else 0.0,
+        'mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'max_ms': round(max(latencies), 2) if latencies else 0.0,
+        'queries_mean': round(sum(queries) / len(queries), 2) if queries else None,
+        'queries_max': max(queries) if queries else None,
+    }
+
+def run_client(scenarios, targets, requests, warmup, rng):
+    clients = {}
+    for uid in targets['viewers']:
+        client = app.test_client()
+        with client.session_transaction() as s:
+            s['user_id'] = uid
+        clients[uid] = client
+    results = {}
+    for scenario in scenarios:
+        latencies, queries, statuses = [], [], []
+        started = time.perf_counter()
+        for i in range(warmup + requests):
+            viewer = rng.choice(targets['viewers'])
+            method, path = build_request(scenario, viewer, targets, rng)
+            t0 = time.perf_counter()
+            resp = clients[viewer].open(path, method=method, headers=METRICS_HEADERS)
+            elapsed = (time.perf_counter() - t0) * 1000
+            if i < warmup:
+                started = time.perf_counter()
+                continue
+            latencies.append(elapsed)
+            statuses.append(resp.status_code)
+            if 'X-Query-Count' in resp.headers:
+                queries.append(int(resp.headers['X-Query-Count']))
+        results[scenario] = summarize(latencies, queries, statuses, time.perf_counter() - started)
+        print_row(scenario, results[scenario])
+    return results
+
+def run_http(scenarios, targets, requests, warmup, rng, base_url, concurrency):
+    import requests as http  # para sa --mode http ra
+
+    local = threading.local()
+    def session_for(viewer):
+        sessions = getattr(local, 'sessions', None)
+        if sessions is None:
+            sessions = local.sessions = {}
+        if viewer not in sessions:
+            s = http.Session()
+            s.headers.update(METRICS_HEADERS)
+            s.post(f"{base_url}/login", data={'username': targets['names'][viewer], 'password': SEED_PASSWORD}, allow_redirects=False)
+            sessions[viewer] = s
+        return sessions[viewer]
+
+    def one(job):
+        scenario, viewer, method, path = job
+        t0 = time.perf_counter()
+        try:
+            resp = session_for(viewer).request(method, base_url + path, allow_redirects=False, timeout=60)
+            status, count = resp.status_code, resp.headers.get('X-Query-Count')
+        except http.RequestException:
+            status, count = 599, None
+        return (time.perf_counter() - t0) * 1000, status, int(count) if count else None
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for scenario in scenarios:
+            jobs = []
+            for _ in range(warmup + requests):
+                viewer = rng.choice(targets['viewers'])
+                jobs.append((scenario, viewer) + build_request(scenario, viewer, targets, rng))
+            list(pool.map(one, jobs[:warmup]))
+            started = time.perf_counter()
+            outcomes = list(pool.map(one, jobs[warmup:]))
+            wall = time.perf_counter() - started
+            results[scenario] = summarize([o[0] for o in outcomes], [o[2] for o in outcomes if o[2] is not None],
+                                          [o[1] for o in outcomes], wall)
+            print_row(scenario, results[scenario])
+    return results
+
+def serve_profile(profile, port):
+    # Gunicorn gamit ang gunicorn.conf.py, parehas nga DATABASE_URL; hulaton hangtod mo-tubag
+    import requests as http
+    env = dict(os.environ, GUNICORN_PROFILE=profile, PORT=str(port), METRICS_TOKEN=METRICS_TOKEN)
+    proc = subprocess.Popen(['gunicorn', '-c', 'gunicorn.conf.py'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"gunicorn ({profile}) exited with code {proc.returncode}")
+        try:
+            http.get(f"http://127.0.0.1:{port}/offline", timeout=1)
+            return proc
+        except http.RequestException:
+            time.sleep(0.5)
+    proc.terminate()
+    raise SystemExit(f"gunicorn ({profile}) did not start within 60s")
+
+def usable_cores():
+    # Parehas sa gunicorn.conf.py: ang CPUs nga gi-allow sa container, dili ang tibuok host
+    return len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+def run_profiles(profiles, scenarios, targets, requests, warmup, seed, concurrency, port):
+    # Parehas nga request sequence (seed) para sa matag profile; rps_per_core para ma-compare sa lain nga host
+    cores = usable_cores()
+    results = {}
+    for profile in profiles:
+        print(f"--- {profile} ---")
+        proc = serve_profile(profile, port)
+        try:
+            for scenario, r in run_http(scenarios, targets, requests, warmup, random.Random(seed),
+                                        f"http://127.0.0.1:{port}", concurrency).items():
+                r['rps_per_core'] = round(r['throughput_rps'] / cores, 2)
+                results[f"{profile}:{scenario}"] = r
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+    print(f"{'scenario':<10} " + ''.join(f"{p + ' rps/core':>20}" for p in profiles))
+    for scenario in scenarios:
+        print(f"{scenario:<10} " + ''.join(f"{results[f'{p}:{scenario}']['rps_per_core']:>20}" for p in profiles))
+    return results
+
+def print_row(name, r):
+    print(f"{name:<10} {r['requests']:>6} req {r['throughput_rps']:>9.1f} rps  p50 {r['p50_ms']:>8.2f}  "
+          f"p95 {r['p95_ms']:>8.2f}  p99 {r['p99_ms']:>8.2f} ms  queries {r['queries_mean']}  errors {r['errors']}  "
+          f"shed {r['shed']} ({r['shed_pct']}%)")
+
+def build_viral_post(author_id, liker_ids, tag):
+    post_id = db.session.query(func.coalesce(func.max(Post.id), 0)).scalar() + 1
+    bulk_insert(Post, [{'id': post_id, 'title': f'Viral {tag}', 'content': 'viral', 'slug': f'delete-bench-{tag}-{post_id}',
+                        'author': f'delbench{author_id}', 'author_id': author_id, 'approved': True,
+                        'like_count': len(liker_ids), 'comment_count': len(liker_ids) // 10}])
+    bulk_insert(Like, [{'user_id': uid, 'post_id': post_id} for uid in liker_ids])
+    bulk_insert(Comment, [{'user_id': uid, 'post_id': post_id, 'content': 'wow'} for uid in liker_ids[::10]])
+    bulk_insert(Notification, [{'user_id': author_id, 'sender_id': liker_ids[-1], 'post_id': post_id, 'notif_type': 'like',
+                                'group_key': f'like:{post_id}', 'actor_count': len(liker_ids), 'message': 'liked your post'}])
+    fix_sequences()
+    return post_id
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    db.session.commit()
+    return round((time.perf_counter() - t0) * 1000, 1)
+
+def delete_timing(n_likes):
+    # Post nga n_likes ka likes (+ n/10 comments): daan nga ORM cascade vs set-based delete_posts/delete_users
+    first = db.session.query(func.coalesce(func.max(User.id), 0)).scalar() + 1
+    ids = list(range(first, first + n_likes + 1))
+    bulk_insert(User, [{'id': uid, 'username': f'delbench{uid}', 'password': 'x'} for uid in ids])
+    fix_sequences()
+    author, likers = ids[0], ids[1:]
+    results = {'likes': n_likes}
+
+    post_id = build_viral_post(author, likers, 'orm')
+    def orm_cascade():
+        # Mao ni ang daan nga delete_post: i-load ang tanang children sa session, dayon usa-usa nga DELETE
+        post = db.session.get(Post, post_id)
+        post.likes, post.comments, post.notifications
+        db.session.delete(post)
+    results['orm_cascade_ms'] = timed(orm_cascade)
+
+    post_id = build_viral_post(author, likers, 'bulk')
+    results['delete_posts_ms'] = timed(lambda: delete_posts([post_id]))
+
+    build_viral_post(author, likers, 'user')
+    results['delete_user_ms'] = timed(lambda: delete_users([author]))
+
+    # Limpyo: ang synthetic likers (batched para sa SQLite parameter limit)
+    for start in range(0, len(likers), 5000):
+        delete_users(likers[start:start + 5000])
+        db.session.commit()
+    for name in ('orm_cascade_ms', 'delete_posts_ms', 'delete_user_ms'):
+        print(f"{name:<16} {results[name]:>10.1f} ms  ({n_likes} likes, {n_likes // 10} comments)")
+    return results
+
+def follow_timing(n_followers, rng):
+    # Celebrity nga n_followers; ang viewer nag-follow og 100 niini, nga matag usa nag-follow og 30
+    first = db.session.query(func.coalesce(func.max(User.id), 0)).scalar() + 1
+    ids = list(range(first, first + n_followers + 1))
+    bulk_insert(User, [{'id': uid, 'username': f'graphbench{uid}', 'password': 'x'} for uid in ids])
+    celebrity, fans = ids[0], ids[1:]
+    viewer, friends = fans[0], fans[1:101]
+    edges = {(uid, celebrity) for uid in fans} | {(viewer, uid) for uid in friends}
+    for uid in friends:
+        edges.update((uid, other) for other in rng.sample(fans, 30) if other != uid)
+    bulk_insert(Follow, [{'follower_id': a, 'followed_id': b} for a, b in edges])
+    fix_sequences()
+
+    def ms(fn):
+        t0 = time.perf_counter()
+        fn()
+        return round((time.perf_counter() - t0) * 1000, 3)
+    follow_graph.forget(*ids)
+    results = {'followers': n_followers, 'edges': len(edges)}
+    results['cold_load_ms'] = ms(lambda: follow_graph.followers_of(celebrity))
+    results['warm_load_ms'] = ms(lambda: follow_graph.followers_of(celebrity))
+    results['is_following_500_ms'] = ms(lambda: follow_graph.is_following_many(viewer, rng.sample(fans, 500)))
+    middle = follow_graph.followers_of(celebrity)[n_followers // 2]
+    results['deep_page_ms'] = ms(lambda: follow_graph.page(follow_graph.followers_of(celebrity), middle))
+    results['mutuals_ms'] = ms(lambda: follow_graph.mutuals(viewer, celebrity))
+    results['suggestions_cold_ms'] = ms(lambda: follow_graph.suggestions(viewer))
+    results['suggestions_warm_ms'] = ms(lambda: follow_graph.suggestions(viewer))
+
+    follow_graph.forget(*ids)
+    for start in range(0, len(ids), 5000):
+        delete_users(ids[start:start + 5000])
+        db.session.commit()
+    for name, value in results.items():
+        print(f"{name:<22} {value:>12}")
+    return results
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(old_path, new_path):
+    old, new = json.load(open(old_path)), json.load(open(new_path))
+    print(f"{'scenario':<10} {'metric':<15} {'old':>10} {'new':>10} {'change':>9}")
+    for scenario, after in new['scenarios'].items():
+        before = old['scenarios'].get(scenario)
+        if not before: continue
+        for metric in ('throughput_rps', 'rps_per_core', 'p50_ms', 'p95_ms', 'p99_ms', 'queries_mean', 'shed_pct'):
+            a, b = before.get(metric), after.get(metric)
+            if a is None or b is None: continue
+            change = f"{(b - a) / a * 100:+.1f}%" if a else 'n/a'
+            print(f"{scenario:<10} {metric:<15} {a:>10} {b:>10} {change:>9}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the main Seven33 routes against seeded data.")
+    parser.add_argument('--mode', choices=['client', 'http'], default='client')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help="base URL for --mode http")
+    parser.add_argument('--concurrency', type=int, default=8, help="parallel requests for --mode http")
+    parser.add_argument('--requests', type=int, default=200, help="measured requests per scenario")
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=733)
+    parser.add_argument('--out', help="JSON output path (default bench_results/<timestamp>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two saved runs and exit")
+    parser.add_argument('--profiles', help="--mode http: start gunicorn once per profile (e.g. sync,threads,eventlet) and compare")
+    parser.add_argument('--port', type=int, default=5077, help="port for the --profiles servers")
+    parser.add_argument('--follow-timing', type=int, metavar='FOLLOWERS', help="time follow-graph lookups for an account with this many followers and exit")
+    parser.add_argument('--delete-timing', type=int, metavar='LIKES', help="time deleting a post/user with this many likes and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        raise SystemExit(0)
+    # Mo-write ang bench (likes, viral posts): dili gyud sa default/production DB
+    if not os.environ.get('DATABASE_URL'):
+        raise SystemExit("bench.py: set DATABASE_URL to the seeded local database first")
+    if args.follow_timing:
+        with app.app_context():
+            follow_timing(args.follow_timing, random.Random(args.seed))
+        raise SystemExit(0)
+    if args.delete_timing:
+        with app.app_context():
+            delete_timing(args.delete_timing)
+        raise SystemExit(0)
+
+    rng = random.Random(args.seed)
+    scenarios = [s for s in args.scenarios.split(',') if s]
+    with app.app_context():
+        targets = sample_targets(rng)
+        meta = {
+            'mode': args.mode,
+            'url': args.url if args.mode == 'http' else None,
+            'concurrency': args.concurrency if args.mode == 'http' else 1,
+            'profiles': args.profiles.split(',') if args.profiles else None,
+            'cores': usable_cores(),
+            'requests_per_scenario': args.requests,
+            'rate_limit': app.config['RATE_LIMIT_ENABLED'],
+            'database': db.engine.url.render_as_string(hide_password=True),
+            'users': db.session.query(func.count(User.id)).scalar(),
+            'posts': db.session.query(func.count(Post.id)).scalar(),
+            'git': git_revision(),
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+    if args.mode == 'client':
+        with app.app_context():
+            results = run_client(scenarios, targets, args.requests, args.warmup, rng)
+    elif args.profiles:
+        results = run_profiles(args.profiles.split(','), scenarios, targets, args.requests, args.warmup, args.seed,
+                               args.concurrency, args.port)
+    else:
+        results = run_http(scenarios, targets, args.requests, args.warmup, rng, args.url.rstrip('/'), args.concurrency)
+
+    out = args.out or os.path.join('bench_results', time.strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump({'meta': meta, 'scenarios': results}, f, indent=2)
+    print(f"Saved {out}")
@@ -1,5 +1,6 @@
-from app import app, db
+from app import app, db, stamp_schema
 with app.app_context():
     db.drop_all()
     db.create_all()
+    stamp_schema()
     print("SUCCESS: Human na! Register na.")
@@ -0,0 +1,46 @@
+# Gunicorn serving profiles. Pilia gamit ang GUNICORN_PROFILE:
+#
+#   gunicorn -c gunicorn.conf.py                                  # eventlet (default, real-time)
+#   GUNICORN_PROFILE=threads gunicorn -c gunicorn.conf.py         # gthread: workers x threads
+#   GUNICORN_PROFILE=sync WEB_CONCURRENCY=5 gunicorn -c gunicorn.conf.py
+#
+# eventlet:  usa ka worker kada core, libo-libo ka greenlets. Ang socket I/O (pg8000, Cloudinary,
+#            Socket.IO) kay green human sa monkey_patch; maayo sa daghang idle/long-polling clients.
+# threads:   OS threads, walay monkey patching. Luwas kung naay library nga dili green-friendly.
+# sync:      usa ka request kada process. Baseline para sa bench.py --profiles; ang Socket.IO
+#            long-polling mo-block sa worker, so dili ni para sa production.
+#
+# Socket.IO sa >1 worker: i-set ang SOCKETIO_MESSAGE_QUEUE ug sticky sessions sa load balancer.
+import os
+
+PROFILES = {
+    #            worker_class, default workers kada core, threads, DB pool kada worker
+    'sync':     ('sync',     2, 1, 2),
+    'threads':  ('gthread',  1, int(os.environ.get('GUNICORN_THREADS', 8)), None),
+    'eventlet': ('eventlet', 1, 1, 10),
+}
+
+profile = os.environ.get('GUNICORN_PROFILE', 'eventlet')
+if profile not in PROFILES:
+    raise SystemExit(f"GUNICORN_PROFILE must be one of {', '.join(PROFILES)}, not {profile!r}")
+worker_class, workers_per_core, threads, pool_size = PROFILES[profile]
+# Ang CPUs nga gi-allow sa container (cpu_count kay ang tibuok host)
+cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+wsgi_app = 'app:create_app()'
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', cores * workers_per_core + (1 if profile == 'sync' else 0)))
+worker_connections = int(os.environ.get('GUNICORN_CONNECTIONS', 1000))  # eventlet: max greenlets kada worker
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+accesslog = os.environ.get('GUNICORN_ACCESSLOG')  # '-' para stdout
+# Dili i-preload: ang eventlet worker mo-monkey_patch una mo-import sa app, ug ang matag worker
+# maghimo sa iyang kaugalingong DB pool, presence flusher ug media threads (walay na-fork nga sockets).
+preload_app = False
+
+# Ang app mo-basa ani inig create_app() sa worker. Ang threads profile: usa ka connection kada thread
+# (+2 para sa presence flusher ug media worker). Ang eventlet: ang sobra nga greenlets mo-pila sa pool.
+os.environ.setdefault('DB_POOL_SIZE', str(pool_size or threads + 2))
+os.environ.setdefault('DB_MAX_OVERFLOW', '10' if profile == 'eventlet' else '2')
+os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'eventlet' if profile == 'eventlet' else 'threading')
@@ -0,0 +1,212 @@
+# Synthetic data para ma-reproduce ang production load shape sa local.
+# Gamita uban sa DATABASE_URL (SQLite o local Postgres), DILI sa production DB. Kinahanglan
+# explicit ang DATABASE_URL, ug ang --reset ra ang mo-drop sa existing tables:
+#
+#   DATABASE_URL=sqlite:////tmp/seven33.db python seed.py --scale medium --reset
+#   DATABASE_URL=postgresql://localhost/seven33 python seed.py --users 5000 --seed 7
+#
+# Tanang seeded users kay naay password nga SEED_PASSWORD (para sa bench.py --mode http).
+import argparse
+import bisect
+import itertools
+import os
+import random
+import secrets
+import time
+from datetime import timedelta
+
+from sqlalchemy import insert, inspect, select, text
+from werkzeug.security import generate_password_hash
+
+# Local tool: random SECRET_KEY kung wala (ang app mo-refuse kung walay SECRET_KEY sa production)
+os.environ.setdefault('SECRET_KEY', secrets.token_hex(32))
+
+from app import (app, db, stamp_schema, ph_time, User, Post, Like, Comment, Follow, Message,
+                 Notification, NotificationActor, TimelineEntry, FANOUT_FOLLOWER_LIMIT, trim_timelines,
+                 recount_counters, backfill_conversations, backfill_hashtags, reindex_search,
+                 maintain_partitions)
+
+SEED_PASSWORD = 'password'
+BATCH_SIZE = 5000
+DAYS_OF_HISTORY = 90
+
+SCALES = {
+    #          users, posts/user, likes/post, comments/post, follows/user, convos/user, msgs/convo
+    'small':  (200,    5,  8,  2, 20, 2, 20),
+    'medium': (2000,   8, 15,  3, 40, 3, 30),
+    'large':  (20000, 10, 20,  4, 60, 3, 40),
+}
+
+WORDS = ("sunset beach coffee cebu travel food code python music island dagat kape adlaw "
+         "gabii trabaho eskwela lungsod bukid ulan init lami nindot salamat barkada").split()
+HASHTAGS = ("cebu travel food coffee tech python music beach sunset lifestyle photography fitness "
+            "gaming art books movies nature dagat kape budget startup design").split()
+
+def zipf_picker(rng, population, s=1.1):
+    # Power-law: pipila ka "celebrity" ids ang makakuha sa kadaghanan sa follows/likes
+    ranked = list(population)
+    rng.shuffle(ranked)
+    cum, total = [], 0.0
+    for rank in range(1, len(ranked) + 1):
+        total += 1.0 / rank ** s
+        cum.append(total)
+    return lambda k: [ranked[bisect.bisect(cum, rng.random() * total)] for _ in range(k)]
+
+def heavy_tail(rng, mean, cap):
+    # Pareto nga mean ~= mean (alpha 2), gi-cap para dili molapas
+    return min(cap, int(rng.paretovariate(2.0) * mean / 2))
+
+def sentence(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+def random_time(rng, now):
+    return now - timedelta(seconds=rng.randint(0, DAYS_OF_HISTORY * 86400))
+
+def bulk_insert(model, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(insert(model), rows[start:start + BATCH_SIZE])
+    db.session.commit()
+    return len(rows)
+
+def fix_sequences():
+    # Explicit ids ang gi-insert, so i-sync ang Postgres sequences
+    if db.engine.dialect.name != 'postgresql': return
+    for table in ('user', 'post', 'like', 'comment', 'follow', 'message', 'notification'):
+        db.session.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), COALESCE((SELECT MAX(id) FROM \"{table}\"), 1))"
+        ))
+    db.session.commit()
+
+def build_timelines():
+    # Bulk fan-out: usa ka INSERT ... SELECT imbes nga kada post
+    followers = select(Follow.follower_id, Post.id, Post.author_id, Post.created_at).join(
+        Post, Post.author_id == Follow.followed_id
+    ).join(User, User.id == Post.author_id).where(Post.approved == True, User.follower_count <= FANOUT_FOLLOWER_LIMIT)
+    db.session.execute(insert(TimelineEntry).from_select(['user_id', 'post_id', 'author_id', 'created_at'], followers))
+    trim_timelines(select(User.id))
+    db.session.commit()
+
+def seed(scale, rng):
+    n_users, posts_per_user, likes_per_post, comments_per_post, follows_per_user, convos_per_user, msgs_per_convo = scale
+    now = ph_time()
+    counts = {}
+    password = generate_password_hash(SEED_PASSWORD)  # usa ra ka hash, hinay ang pbkdf2
+
+    user_ids = list(range(1, n_users + 1))
+    counts['users'] = bulk_insert(User, [{
+        'id': uid, 'username': f'user{uid}', 'password': password, 'is_admin': uid == 1,
+        'bio': sentence(rng, rng.randint(3, 15)), 'created_at': random_time(rng, now), 'last_seen': random_time(rng, now),
+    } for uid in user_ids])
+
+    popular = zipf_picker(rng, user_ids)
+    follows = set()
+    for uid in user_ids:
+        for target in popular(heavy_tail(rng, follows_per_user, n_users // 2)):
+            if target != uid:
+                follows.add((uid, target))
+    counts['follows'] = bulk_insert(Follow, [
+        {'id': i, 'follower_id': a, 'followed_id': b, 'created_at': random_time(rng, now)}
+        for i, (a, b) in enumerate(sorted(follows), 1)
+    ])
+
+    posts, post_id = [], 0
+    prolific = zipf_picker(rng, user_ids, s=0.8)
+    for author_id in prolific(n_users * posts_per_user):
+        post_id += 1
+        media = rng.random()
+        posts.append({
+            'id': post_id, 'title': sentence(rng, rng.randint(2, 8)).capitalize(),
+            'content': sentence(rng, int(rng.lognormvariate(3.5, 1.0)) + 5),
+            'hashtags': ', '.join(rng.sample(HASHTAGS, rng.randint(0, 4))),
+            'slug': f'seed-post-{post_id}', 'author': f'user{author_id}', 'author_id': author_id,
+            'created_at': random_time(rng, now), 'approved': True,
+            'media_file': f'https://res.cloudinary.com/demo/{"video" if media < 0.05 else "image"}/upload/seed/{post_id}' if media < 0.3 else None,
+            'media_type': ('video' if media < 0.05 else 'image') if media < 0.3 else None,
+        })
+    counts['posts'] = bulk_insert(Post, posts)
+
+    likes, comments, notifications, notification_actors = set(), [], {}, {}
+    likers = zipf_picker(rng, user_ids)
+    for post in posts:
+        for uid in likers(heavy_tail(rng, likes_per_post, n_users // 4)):
+            likes.add((uid, post['id'], post['author_id']))
+        for uid in likers(heavy_tail(rng, comments_per_post, 200)):
+            comments.append({'post_id': post['id'], 'user_id': uid, 'content': sentence(rng, rng.randint(2, 20)),
+                             'created_at': post['created_at'] + timedelta(minutes=rng.randint(1, 5000))})
+    counts['likes'] = bulk_insert(Like, [
+        {'id': i, 'user_id': uid, 'post_id': pid} for i, (uid, pid, _) in enumerate(sorted(likes), 1)
+    ])
+    counts['comments'] = bulk_insert(Comment, [dict(c, id=i) for i, c in enumerate(comments, 1)])
+    def notify(author_id, sender_id, pid, kind, message, at):
+        # Grouped parehas sa record_notification: usa ka row kada (recipient, post, type)
+        row = notifications.setdefault((author_id, pid, kind), {
+            'user_id': author_id, 'post_id': pid, 'notif_type': kind, 'group_key': f'{kind}:{pid}', 'message': message,
+            'is_read': rng.random() < 0.7, 'actor_count': 0, 'created_at': at, 'updated_at': at, 'sender_id': sender_id})
+        actors = notification_actors.setdefault((author_id, pid, kind), set())
+        if sender_id not in actors:
+            actors.add(sender_id)
+            row['actor_count'] += 1
+        row['created_at'], row['updated_at'] = min(row['created_at'], at), max(row['updated_at'], at)
+        if row['updated_at'] == at:
+            row['sender_id'] = sender_id
+    for uid, pid, author_id in itertools.islice(likes, 0, None, 3):
+        if uid != author_id:
+            notify(author_id, uid, pid, 'like', 'liked your post', random_time(rng, now))
+    for c in comments[::2]:
+        author_id = posts[c['post_id'] - 1]['author_id']
+        if c['user_id'] != author_id:
+            notify(author_id, c['user_id'], c['post_id'], 'comment', 'commented on your post', c['created_at'])
+    counts['notifications'] = bulk_insert(Notification, [dict(n, id=i) for i, n in enumerate(notifications.values(), 1)])
+    bulk_insert(NotificationActor, [{'notification_id': i, 'sender_id': sender_id}
+                                    for i, key in enumerate(notifications, 1) for sender_id in notification_actors[key]])
+
+    messages, pairs = [], set()
+    for uid in user_ids:
+        for partner in popular(rng.randint(0, convos_per_user * 2)):
+            if partner != uid and (partner, uid) not in pairs:
+                pairs.add((uid, partner))
+    for a, b in pairs:
+        start = random_time(rng, now)
+        for k in range(heavy_tail(rng, msgs_per_convo, 2000) + 1):
+            sender, receiver = (a, b) if rng.random() < 0.5 else (b, a)
+            messages.append({'sender_id': sender, 'receiver_id': receiver, 'content': sentence(rng, rng.randint(1, 15)),
+                             'created_at': start + timedelta(minutes=k * rng.randint(1, 30)), 'is_read': rng.random() < 0.8})
+    messages.sort(key=lambda m: m['created_at'])
+    counts['messages'] = bulk_insert(Message, [dict(m, id=i) for i, m in enumerate(messages, 1)])
+
+    fix_sequences()
+    maintain_partitions()  # Postgres: ang 90 days nga history kay ibalhin gikan sa DEFAULT partition
+    # Derived tables: counters, inbox summaries, timelines, hashtags, search
+    recount_counters()
+    backfill_conversations()
+    build_timelines()
+    backfill_hashtags()
+    reindex_search()
+    return counts
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate synthetic Seven33 data (users, posts, likes, follows, messages).")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--users', type=int, help="override the number of users for the chosen scale")
+    parser.add_argument('--seed', type=int, default=733, help="random seed, same seed = same data")
+    parser.add_argument('--reset', action='store_true', help="drop and recreate every table first (deletes all data)")
+    args = parser.parse_args()
+    if not os.environ.get('DATABASE_URL'):
+        raise SystemExit("seed.py: set DATABASE_URL to a local SQLite/Postgres database first")
+
+    scale = list(SCALES[args.scale])
+    if args.users:
+        scale[0] = args.users
+    with app.app_context():
+        print(f"Seeding {db.engine.url.render_as_string(hide_password=True)} ...")
+        if args.reset:
+            db.drop_all()
+        if args.reset or not inspect(db.engine).has_table('user'):
+            db.create_all()
+            stamp_schema()
+        elif db.session.query(User.id).first():
+            raise SystemExit("seed.py: the database already has users; pass --reset to drop all tables and reseed")
+        started = time.perf_counter()
+        counts = seed(scale, random.Random(args.seed))
+        print(f"SUCCESS sa {time.perf_counter() - started:.1f}s: " + ', '.join(f"{v} {k}" for k, v in counts.items()))
+        print(f"Login: user1 (admin) o bisan kinsa nga userN, password '{SEED_PASSWORD}'")
@@ -1,7 +1,167 @@
+// SE7EN service worker.
+// Ang /sw.js route mo-prepend ug APP_VERSION ug APP_SHELL (hashed static URLs + /offline),
+// so mausab ang worker (ug ma-refresh ang shell cache) kada deploy nga nay nausab nga asset.
+const VERSION = typeof APP_VERSION !== 'undefined' ? APP_VERSION : 'dev';
+const SHELL = typeof APP_SHELL !== 'undefined' ? APP_SHELL : ['/offline'];
+const SHELL_CACHE = `se7en-shell-${VERSION}`;
+const RUNTIME_CACHE = 'se7en-runtime';
+const RUNTIME_MAX_ENTRIES = 200;
+const OFFLINE_URL = '/offline';
+const LOGOUT_URL = '/logout';
+const OUTBOX_DB = 'se7en-outbox';
+const OUTBOX_TAG = 'se7en-outbox';
+const QUEUEABLE = /^\/(like|comment)\/\d+$/;
+const SWR_HOSTS = ['res.cloudinary.com', 'ui-avatars.com', 'cdn.tailwindcss.com', 'cdn.socket.io'];
+
 self.addEventListener('install', (e) => {
-  console.log('SE7EN App: Installed');
+  e.waitUntil(caches.open(SHELL_CACHE).then((cache) => cache.addAll(SHELL)).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (e) => {
+  e.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(keys.filter((k) => k.startsWith('se7en-shell-') && k !== SHELL_CACHE).map((k) => caches.delete(k))))
+      .then(() => self.clients.claim())
+  );
 });
 
 self.addEventListener('fetch', (e) => {
-  e.respondWith(fetch(e.request));
+  const req = e.request;
+  const url = new URL(req.url);
+  const sameOrigin = url.origin === self.location.origin;
+
+  if (req.method === 'POST' && sameOrigin && QUEUEABLE.test(url.pathname)) {
+    e.respondWith(networkOrQueue(req));
+    return;
+  }
+  if (req.method !== 'GET') return;
+
+  if (sameOrigin && url.pathname === LOGOUT_URL) {
+    e.respondWith(clearUserData().then(() => fetch(req)).catch(() => caches.match(OFFLINE_URL)));
+    return;
+  }
+  if (sameOrigin && url.pathname.startsWith('/static/') && url.searchParams.has('v')) {
+    e.respondWith(cacheFirst(req));                 // immutable, hashed
+  } else if (sameOrigin && url.pathname === '/api/feed') {
+    e.respondWith(staleWhileRevalidate(e, req));    // feed JSON
+  } else if (SWR_HOSTS.includes(url.hostname)) {
+    e.respondWith(staleWhileRevalidate(e, req));    // avatars, media thumbnails, CDN scripts
+  } else if (req.mode === 'navigate') {
+    e.respondWith(networkFirst(e, req));
+  }
+});
+
+async function cacheFirst(req) {
+  const cached = await caches.match(req);
+  if (cached) return cached;
+  const res = await fetch(req);
+  if (res.ok) (await caches.open(SHELL_CACHE)).put(req, res.clone());
+  return res;
+}
+
+async function staleWhileRevalidate(e, req) {
+  const cache = await caches.open(RUNTIME_CACHE);
+  const cached = await cache.match(req);
+  const network = fetch(req).then(async (res) => {
+    if (res.ok || res.type === 'opaque') {
+      await cache.put(req, res.clone());
+      await trimCache(cache);
+    }
+    return res;
+  }).catch(() => cached);
+  if (cached) {
+    e.waitUntil(network);
+    return cached;
+  }
+  return network;
+}
+
+async function networkFirst(e, req) {
+  try {
+    const res = await fetch(req);
+    // Public pages ra: ang pages sa naka-login (Cache-Control: private) dili i-save sa disk
+    if (res.ok && !/private|no-store/.test(res.headers.get('Cache-Control') || '')) {
+      const copy = res.clone();
+      e.waitUntil(caches.open(RUNTIME_CACHE).then((cache) => cache.put(req, copy).then(() => trimCache(cache))));
+    }
+    return res;
+  } catch (err) {
+    return (await caches.match(req)) || (await caches.match(OFFLINE_URL));
+  }
+}
+
+async function trimCache(cache) {
+  const keys = await cache.keys();
+  for (const key of keys.slice(0, Math.max(0, keys.length - RUNTIME_MAX_ENTRIES))) {
+    await cache.delete(key);
+  }
+}
+
+// Logout: ang runtime cache (feed JSON, pages) ug ang outbox kay sa user nga nag-logout;
+// papason para dili makita o ma-send sa sunod nga user sa parehas nga browser.
+function clearUserData() {
+  return Promise.all([
+    caches.delete(RUNTIME_CACHE),
+    outboxTx('readwrite', (store) => store.clear()).catch(() => {}),
+  ]);
+}
+
+// --- BACKGROUND SYNC: likes ug comments nga gi-himo samtang offline ---
+function openOutbox() {
+  return new Promise((resolve, reject) => {
+    const open = indexedDB.open(OUTBOX_DB, 1);
+    open.onupgradeneeded = () => open.result.createObjectStore('requests', { keyPath: 'id', autoIncrement: true });
+    open.onsuccess = () => resolve(open.result);
+    open.onerror = () => reject(open.error);
+  });
+}
+
+function outboxTx(mode, fn) {
+  return openOutbox().then((db) => new Promise((resolve, reject) => {
+    const tx = db.transaction('requests', mode);
+    const result = fn(tx.objectStore('requests'));
+    tx.oncomplete = () => resolve(result.result);
+    tx.onerror = () => reject(tx.error);
+  }));
+}
+
+async function networkOrQueue(req) {
+  const body = await req.clone().text();
+  try {
+    return await fetch(req);
+  } catch (err) {
+    await outboxTx('readwrite', (store) => store.add({
+      url: req.url,
+      method: req.method,
+      contentType: req.headers.get('Content-Type'),
+      body: body,
+      queuedAt: Date.now(),
+    }));
+    if (self.registration.sync) {
+      await self.registration.sync.register(OUTBOX_TAG).catch(() => {});
+    }
+    return new Response(JSON.stringify({ queued: true }), {
+      status: 202,
+      headers: { 'Content-Type': 'application/json' },
+    });
+  }
+}
+
+async function flushOutbox() {
+  const items = await outboxTx('readonly', (store) => store.getAll());
+  for (const item of items) {
+    const headers = item.contentType ? { 'Content-Type': item.contentType } : {};
+    // Kung offline pa, mo-throw ni ug i-retry sa browser ang sync
+    await fetch(item.url, { method: item.method, headers: headers, body: item.body || undefined, credentials: 'same-origin' });
+    await outboxTx('readwrite', (store) => store.delete(item.id));
+  }
+}
+
+self.addEventListener('sync', (e) => {
+  if (e.tag === OUTBOX_TAG) e.waitUntil(flushOutbox());
+});
+
+// Fallback para sa browsers nga walay Background Sync: ang page mo-post ani inig 'online'
+self.addEventListener('message', (e) => {
+  if (e.data && e.data.type === 'flush-outbox') e.waitUntil(flushOutbox().catch(() => {}));
 });